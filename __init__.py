@@ -1,102 +1,184 @@
 import subprocess
 import tempfile
-import datetime
+import time
 import os
-import threading
 import atexit
+import functools
+import queue
+import threading
 from aqt import mw, gui_hooks
-from aqt.utils import tooltip, showInfo
-from anki.hooks import addHook, remHook
+from aqt.utils import tooltip
+from anki.hooks import addHook
 
 # Try to import Qt components for shortcuts and always-on-top functionality
 try:
-    from PyQt5.QtCore import Qt
+    from PyQt5.QtCore import Qt, QTimer
     from PyQt5.QtWidgets import QShortcut
     from PyQt5.QtGui import QKeySequence
 except ImportError:
     try:
-        from PyQt6.QtCore import Qt
+        from PyQt6.QtCore import Qt, QTimer
         from PyQt6.QtWidgets import QShortcut
         from PyQt6.QtGui import QKeySequence
     except ImportError:
         Qt = None
+        QTimer = None
         QShortcut = None
         QKeySequence = None
 
+# Hide the AutoHotkey console window on Windows
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+
+# Reviewer answer buttons used by the scoring hotkeys
+EASE_AGAIN = 1
+EASE_GOOD = 3
+_EASE_TOOLTIPS = {
+    EASE_AGAIN: "🔄 Card scored as Again",
+    EASE_GOOD: "✅ Card scored as Good",
+}
+
+# Ignore always-on-top toggles arriving this soon after the previous press, so a
+# held Ctrl+O (repeated by AutoHotkey every ~110 ms) flips the window only once
+TOGGLE_DEBOUNCE_SECONDS = 0.2
+# Ignore score presses arriving this soon after the previous press, so a held
+# Ctrl+Z/Ctrl+X (repeated by AutoHotkey every ~100 ms) answers one card, not several
+SCORE_DEBOUNCE_SECONDS = 0.3
+
 # Setup debug logging
 addon_dir = os.path.dirname(__file__)
 debug_file = os.path.join(tempfile.gettempdir(), "anki_hotkey_debug.txt")
 
+# Set ANKI_HOTKEY_DEBUG=1 to write diagnostics to debug_file and the console
+DEBUG = os.environ.get("ANKI_HOTKEY_DEBUG", "") not in ("", "0")
+# Start a fresh log once the previous sessions have grown past this size
+DEBUG_FILE_MAX_BYTES = 1_000_000
+_log_fh = None
+_log_queue = queue.SimpleQueue()
+_log_thread = None
+_last_ts_sec = -1
+_last_ts_str = ""
+
+def _timestamp():
+    """Return the current HH:MM:SS, reformatting only when the second changes"""
+    global _last_ts_sec, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_sec = now
+        _last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+    return _last_ts_str
+
 def debug_log(message):
-    timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-    with open(debug_file, "a", encoding="utf-8") as f:
-        f.write(f"[{timestamp}] {message}\n")
-    print(message)  # Also print to console
+    if not DEBUG:
+        return
+    # Hand the line to the writer thread so callers never wait on disk I/O
+    _log_queue.put(f"[{_timestamp()}] {message}\n")
+
+def _drain_debug_log():
+    """Write queued debug lines to the log file and console, batching bursts"""
+    while True:
+        batch = [_log_queue.get()]
+        while not _log_queue.empty():
+            batch.append(_log_queue.get_nowait())
+        text = "".join(line for line in batch if line is not None)
+        if text:
+            if _log_fh is not None:
+                _log_fh.write(text)
+            print(text, end="")  # Also print to console
+        if None in batch:
+            # Only this thread writes to the file, so it is the one to close it
+            if _log_fh is not None:
+                _log_fh.close()
+            return
 
-# Clear previous debug log
-try:
-    with open(debug_file, "w", encoding="utf-8") as f:
-        f.write(f"=== Anki AutoHotkey Global Hotkeys Debug Log Started at {datetime.datetime.now()} ===\n")
-        f.write(f"Debug file location: {debug_file}\n\n")
-except Exception as e:
-    print(f"Could not create debug file: {e}")
+def _stop_debug_log():
+    """Ask the writer thread to flush pending debug lines and close the log file"""
+    _log_queue.put(None)
+    _log_thread.join(timeout=1)
+
+# Open the debug log once, clearing it only when it has grown too large
+if DEBUG:
+    try:
+        if os.path.exists(debug_file) and os.path.getsize(debug_file) <= DEBUG_FILE_MAX_BYTES:
+            log_mode = "a"
+        else:
+            log_mode = "w"
+        # Line-buffered so the log stays readable if Anki crashes
+        _log_fh = open(debug_file, log_mode, buffering=1, encoding="utf-8")
+        _log_fh.write(f"=== Anki AutoHotkey Global Hotkeys Debug Log Started at {time.ctime()} ===\n")
+        _log_fh.write(f"Debug file location: {debug_file}\n\n")
+    except Exception as e:
+        print(f"Could not create debug file: {e}")
+    _log_thread = threading.Thread(target=_drain_debug_log, name="anki-hotkey-debug-log", daemon=True)
+    _log_thread.start()
+    atexit.register(_stop_debug_log)
 
 class AHKGlobalHotkeyController:
     def __init__(self):
         self.ahk_process = None
-        self.ahk_script_path = None
+
+        # AutoHotkey paths never change during a session, so resolve them once
+        self._ahk_cwd = os.path.join(addon_dir, "ahk")
+        self._ahk_exe = os.path.join(self._ahk_cwd, "AutoHotkey.exe")
+        self.ahk_script_path = os.path.join(self._ahk_cwd, "anki_hotkeys.ahk")
+        self._paths_ok = os.path.exists(self._ahk_exe) and os.path.exists(self.ahk_script_path)
+        # AutoHotkey only acts on its hotkeys while this file exists
+        self._active_flag_path = os.path.join(tempfile.gettempdir(), "anki_hotkeys_active.flag")
+        self._ahk_argv = [self._ahk_exe, self.ahk_script_path, self._active_flag_path]
+        self.hotkeys_enabled = False
+
         self.reviewer_active = False
+        self._reviewer = None  # mw.reviewer, bound while in review state
         self.always_on_top_enabled = False
+        self._last_press_times = {}  # debounce key -> time.monotonic() of the last press
         self.qt_shortcuts = []
+        self._pending_ease = None
+        self._cb_good = functools.partial(self._score_card, EASE_GOOD)
+        self._cb_again = functools.partial(self._score_card, EASE_AGAIN)
+
+        # Single reusable timer that answers the card outside the shortcut handler
+        self._score_timer = None
+        if QTimer is not None:
+            self._score_timer = QTimer()
+            self._score_timer.setSingleShot(True)
+            self._score_timer.timeout.connect(self._answer_pending_score)
+
+        # Clear a flag left behind if Anki previously exited without cleanup
+        self._disable()
 
     def start_global_hotkeys(self):
-        """Start AutoHotkey global hotkeys when reviewing begins"""
+        """Enable AutoHotkey global hotkeys when reviewing begins"""
         debug_log("start_global_hotkeys called")
 
-        if self.ahk_process is not None:
-            debug_log("AutoHotkey process already running")
+        if self.hotkeys_enabled:
+            debug_log("Global hotkeys already enabled")
             return
 
-        # Check if AutoHotkey.exe exists
-        ahk_exe_path = os.path.join(addon_dir, "ahk", "AutoHotkey.exe")
-        if not os.path.exists(ahk_exe_path):
-            error_msg = f"AutoHotkey.exe not found at {ahk_exe_path}"
-            debug_log(error_msg)
-            showInfo(f"Global Hotkeys Error: {error_msg}\\n\\nPlease reinstall the addon.")
+        if not self._ensure_ahk_running():
             return
 
-        # Get AHK script path
-        ahk_script_path = os.path.join(addon_dir, "ahk", "anki_hotkeys.ahk")
-        if not os.path.exists(ahk_script_path):
-            error_msg = f"AutoHotkey script not found at {ahk_script_path}"
-            debug_log(error_msg)
-            showInfo(f"Global Hotkeys Error: {error_msg}\\n\\nPlease reinstall the addon.")
+        if not self._enable():
+            # Without the flag file AutoHotkey passes Ctrl+Z/X/O through to other applications
+            tooltip(f"Global Hotkeys Error: could not create {self._active_flag_path}<br><br>Global hotkeys are not active.", period=5000)
             return
 
-        try:
-            # Start AutoHotkey process
-            debug_log(f"Starting AutoHotkey process: {ahk_exe_path} {ahk_script_path}")
-            self.ahk_process = subprocess.Popen(
-                [ahk_exe_path, ahk_script_path],
-                cwd=os.path.join(addon_dir, "ahk"),
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-            )
-            debug_log(f"AutoHotkey process started with PID: {self.ahk_process.pid}")
-
-            # Setup Qt shortcuts to catch function keys from AHK
-            self._setup_function_key_shortcuts()
+        # Qt shortcuts are normally created at main_window_did_init; this is a no-op then
+        self._setup_function_key_shortcuts()
+        self._set_shortcuts_enabled(True)
 
-            tooltip("🎯 Global hotkeys active!\\n\\nCtrl+Z = Good, Ctrl+X = Again, Ctrl+O = Always on top\\nWorks everywhere - even when Anki is not in focus!", period=4000)
-
-        except Exception as e:
-            error_msg = f"Failed to start AutoHotkey: {e}"
-            debug_log(error_msg)
-            showInfo(f"Global Hotkeys Error: {error_msg}\\n\\nTry running Anki as administrator or check if antivirus is blocking AutoHotkey.")
+        tooltip("🎯 Global hotkeys active!\\n\\nCtrl+Z = Good, Ctrl+X = Again, Ctrl+O = Always on top\\nWorks everywhere - even when Anki is not in focus!", period=4000)
 
     def stop_global_hotkeys(self):
-        """Stop AutoHotkey global hotkeys when reviewing ends"""
+        """Disable AutoHotkey global hotkeys when reviewing ends, leaving the process running"""
         debug_log("stop_global_hotkeys called")
 
+        self._disable()
+        self._set_shortcuts_enabled(False)
+
+    def shutdown(self):
+        """Terminate the AutoHotkey process, then disable and remove the Qt shortcuts"""
+        debug_log("shutdown called")
+
+        # Stop AutoHotkey first so it is never orphaned if Qt objects are already gone
         if self.ahk_process is not None:
             try:
                 debug_log(f"Terminating AutoHotkey process PID: {self.ahk_process.pid}")
@@ -105,12 +187,19 @@ class AHKGlobalHotkeyController:
                 debug_log("AutoHotkey process terminated successfully")
             except subprocess.TimeoutExpired:
                 debug_log("AutoHotkey process did not terminate gracefully, forcing kill")
-                self.ahk_process.kill()
+                try:
+                    self.ahk_process.kill()
+                    # Reap the process so its handle is released now rather than at GC
+                    self.ahk_process.wait(timeout=3)
+                except Exception as e:
+                    debug_log(f"Error killing AutoHotkey process: {e}")
             except Exception as e:
                 debug_log(f"Error stopping AutoHotkey process: {e}")
             finally:
                 self.ahk_process = None
 
+        self.stop_global_hotkeys()
+
         # Clean up Qt shortcuts
         for shortcut in self.qt_shortcuts:
             try:
@@ -120,25 +209,87 @@ class AHKGlobalHotkeyController:
         self.qt_shortcuts.clear()
         debug_log("Qt shortcuts cleaned up")
 
+    def _ensure_ahk_running(self):
+        """Start AutoHotkey once per Anki session, returning whether it is running"""
+        if self.ahk_process is not None and self.ahk_process.poll() is None:
+            return True
+
+        if not self._paths_ok:
+            if not os.path.exists(self._ahk_exe):
+                error_msg = f"AutoHotkey.exe not found at {self._ahk_exe}"
+            else:
+                error_msg = f"AutoHotkey script not found at {self.ahk_script_path}"
+            debug_log(error_msg)
+            from aqt.utils import showInfo  # Only needed on this rare error path
+            showInfo(f"Global Hotkeys Error: {error_msg}\\n\\nPlease reinstall the addon.")
+            return False
+
+        proc = None
+        try:
+            # Start AutoHotkey process
+            debug_log(f"Starting AutoHotkey process: {self._ahk_exe} {self.ahk_script_path}")
+            proc = subprocess.Popen(
+                self._ahk_argv,
+                cwd=self._ahk_cwd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=_CREATION_FLAGS
+            )
+            self.ahk_process = proc
+            debug_log(f"AutoHotkey process started with PID: {proc.pid}")
+            return True
+
+        except Exception as e:
+            # Don't leave an untracked AutoHotkey running if anything after Popen failed
+            if proc is not None:
+                try:
+                    proc.kill()
+                    proc.wait(timeout=3)
+                except Exception as kill_error:
+                    debug_log(f"Error killing AutoHotkey process after failed start: {kill_error}")
+            self.ahk_process = None
+            error_msg = f"Failed to start AutoHotkey: {e}"
+            debug_log(error_msg)
+            tooltip(f"Global Hotkeys Error: {error_msg}\\n\\nTry running Anki as administrator or check if antivirus is blocking AutoHotkey.", period=5000)
+            return False
+
+    def _enable(self):
+        """Let the running AutoHotkey script act on its hotkeys, returning whether that worked"""
+        try:
+            open(self._active_flag_path, "w").close()
+        except OSError as e:
+            debug_log(f"Could not create hotkey flag file: {e}")
+            return False
+        self.hotkeys_enabled = True
+        debug_log("Global hotkeys enabled")
+        return True
+
+    def _disable(self):
+        """Make the AutoHotkey script pass its hotkeys through to other applications"""
+        self.hotkeys_enabled = False
+        try:
+            os.remove(self._active_flag_path)
+            debug_log("Global hotkeys disabled")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            debug_log(f"Could not remove hotkey flag file: {e}")
+
     def _setup_function_key_shortcuts(self):
-        """Setup Qt shortcuts to catch function keys sent by AutoHotkey"""
+        """Setup Qt shortcuts to catch function keys sent by AutoHotkey, once per session"""
+        if self.qt_shortcuts:
+            return
+
         if not QShortcut or not mw:
             debug_log("Cannot setup Qt shortcuts: QShortcut or mw not available")
             return
 
-        # Clear existing shortcuts
-        for shortcut in self.qt_shortcuts:
-            try:
-                shortcut.deleteLater()
-            except Exception as e:
-                debug_log(f"Error deleting existing Qt shortcut: {e}")
-        self.qt_shortcuts.clear()
-
         # Function key mappings (sent by AutoHotkey)
         shortcuts = [
-            ("F13", lambda: self._score_card('good'), "Score card as Good (from AHK Ctrl+Z)"),
-            ("F14", lambda: self._score_card('again'), "Score card as Again (from AHK Ctrl+X)"),
-            ("F15", lambda: self.toggle_always_on_top(), "Toggle always on top (from AHK Ctrl+O)")
+            ("F13", self._cb_good, "Score card as Good (from AHK Ctrl+Z)"),
+            ("F14", self._cb_again, "Score card as Again (from AHK Ctrl+X)"),
+            ("F15", self.toggle_always_on_top, "Toggle always on top (from AHK Ctrl+O)")
         ]
 
         success_count = 0
@@ -152,6 +303,7 @@ class AHKGlobalHotkeyController:
                 shortcut = QShortcut(key_seq, mw)
                 shortcut.activated.connect(callback)
                 shortcut.setContext(Qt.ApplicationShortcut)  # Work anywhere in Anki
+                shortcut.setEnabled(self.hotkeys_enabled)  # Only active during review
 
                 self.qt_shortcuts.append(shortcut)
                 success_count += 1
@@ -162,126 +314,178 @@ class AHKGlobalHotkeyController:
 
         debug_log(f"Successfully created {success_count}/{len(shortcuts)} Qt shortcuts for AHK communication")
 
-    def _score_card(self, score):
-        """Score the current card"""
-        debug_log(f"_score_card called with: {score}")
+    def _set_shortcuts_enabled(self, enabled):
+        """Turn the F13-F15 shortcuts on or off without recreating them"""
+        for shortcut in self.qt_shortcuts:
+            try:
+                shortcut.setEnabled(enabled)
+            except Exception as e:
+                debug_log(f"Error updating Qt shortcut: {e}")
+
+    def _is_repeat_press(self, key, window):
+        """Record a press and return whether it follows the previous one within window seconds"""
+        # Every press extends the window, so a held key counts once until released
+        now = time.monotonic()
+        last_press = self._last_press_times.get(key, 0.0)
+        self._last_press_times[key] = now
+        return now - last_press < window
+
+    def _score_card(self, ease):
+        """Score the current card with the given answer button"""
+        if DEBUG:
+            debug_log(f"_score_card called with ease: {ease}")
+
+        # reviewer_active is kept current by the state_did_change hook
+        if not self.reviewer_active:
+            debug_log("Ignoring score outside of review")
+            return
 
-        if not mw.reviewer or not mw.reviewer.card:
+        reviewer = self._reviewer
+        if not reviewer or not reviewer.card:
             debug_log("No reviewer or card available")
             tooltip("No card to score - start reviewing first!", period=1500)
             return
 
-        def score_on_main_thread():
-            try:
-                debug_log(f"Executing score on main thread: {score}")
-                if score == 'good':
-                    # Score as Good (3)
-                    mw.reviewer._answerCard(3)
-                    debug_log("Card scored as Good (3)")
-                    tooltip("✅ Card scored as Good", period=800)
-                elif score == 'again':
-                    # Score as Again (1)
-                    mw.reviewer._answerCard(1)
-                    debug_log("Card scored as Again (1)")
-                    tooltip("🔄 Card scored as Again", period=800)
-            except Exception as e:
-                debug_log(f"Error scoring card: {e}")
-                tooltip(f"Error scoring card: {e}", period=2000)
+        # Merge repeats of a held hotkey into the first press
+        if self._is_repeat_press("score", SCORE_DEBOUNCE_SECONDS):
+            debug_log("Ignoring score within debounce window")
+            return
+
+        self._pending_ease = ease
+        if not self._score_timer.isActive():
+            self._score_timer.start(0)
 
-        # Execute on main thread
-        mw.progress.timer(10, score_on_main_thread, False)
+    def _answer_pending_score(self):
+        """Answer the current card with the most recent pending ease"""
+        ease = self._pending_ease
+        self._pending_ease = None
+        reviewer = self._reviewer
+        if ease is None or reviewer is None:
+            return
+
+        try:
+            if DEBUG:
+                debug_log(f"Executing score on main thread: {ease}")
+            reviewer._answerCard(ease)
+            if DEBUG:
+                debug_log(f"Card scored with ease {ease}")
+            tooltip(_EASE_TOOLTIPS[ease], period=800)
+        except Exception as e:
+            debug_log(f"Error scoring card: {e}")
+            tooltip(f"Error scoring card: {e}", period=2000)
 
     def toggle_always_on_top(self):
         """Toggle Anki window always-on-top state"""
         if Qt is None:
-            showInfo("Qt library not available for always-on-top functionality")
+            tooltip("Qt library not available for always-on-top functionality", period=5000)
+            return
+
+        # Each real toggle recreates the native window, so drop held-key repeats
+        if self._is_repeat_press("toggle", TOGGLE_DEBOUNCE_SECONDS):
+            debug_log("Ignoring always-on-top toggle within debounce window")
             return
 
         try:
-            self.always_on_top_enabled = not self.always_on_top_enabled
+            enabled = not self.always_on_top_enabled
+            self.always_on_top_enabled = enabled
 
-            if self.always_on_top_enabled:
-                # Enable always-on-top
-                mw.setWindowFlags(mw.windowFlags() | Qt.WindowStaysOnTopHint)
+            # Changing window flags recreates the native window, so only do it when needed
+            if bool(mw.windowFlags() & Qt.WindowStaysOnTopHint) != enabled:
+                mw.setWindowFlag(Qt.WindowStaysOnTopHint, enabled)
                 mw.show()
+
+            if enabled:
                 tooltip("📌 Always-on-top enabled", period=1000)
                 debug_log("Always-on-top enabled")
             else:
-                # Disable always-on-top
-                mw.setWindowFlags(mw.windowFlags() & ~Qt.WindowStaysOnTopHint)
-                mw.show()
                 tooltip("📌 Always-on-top disabled", period=1000)
                 debug_log("Always-on-top disabled")
         except Exception as e:
             error_msg = f"Error toggling always-on-top: {e}"
             debug_log(error_msg)
-            showInfo(error_msg)
-
-    def on_reviewer_did_show_question(self, card):
-        """Called when a card question is shown - start global hotkeys"""
-        debug_log(f"Reviewer showed question. Card: {card}")
-        self.reviewer_active = True
-        self.start_global_hotkeys()
+            tooltip(error_msg, period=5000)
 
     def on_reviewer_will_end(self):
         """Called when reviewer is ending - stop global hotkeys"""
         debug_log("Reviewer ending")
         self.reviewer_active = False
+        self._reviewer = None
         self.stop_global_hotkeys()
 
     def on_main_window_state_changed(self, new_state, old_state):
-        """Called when Anki's main window state changes"""
-        debug_log(f"Main window state changed: {old_state} -> {new_state}")
-        if new_state != "review":
+        """Called when Anki's main window state changes - start or stop global hotkeys"""
+        if DEBUG:
+            debug_log(f"Main window state changed: {old_state} -> {new_state}")
+        if new_state == "review":
+            self.reviewer_active = True
+            self._reviewer = mw.reviewer
+            self.start_global_hotkeys()
+        else:
             self.reviewer_active = False
+            self._reviewer = None
             self.stop_global_hotkeys()
 
 # Global instance
 hotkey_controller = AHKGlobalHotkeyController()
 
+# (hook, callback) pairs registered by setup_hooks, so cleanup detaches exactly those
+_registered_hooks = []
+
 # Hook into Anki events
 def setup_hooks():
+    """Register the controller's hooks; safe to call again after cleanup_hooks"""
     debug_log("Setting up Anki hooks")
-    gui_hooks.reviewer_did_show_question.append(hotkey_controller.on_reviewer_did_show_question)
-    gui_hooks.reviewer_will_end.append(hotkey_controller.on_reviewer_will_end)
-    gui_hooks.state_did_change.append(hotkey_controller.on_main_window_state_changed)
+    for hook, callback in (
+        (gui_hooks.main_window_did_init, hotkey_controller._setup_function_key_shortcuts),
+        (gui_hooks.reviewer_will_end, hotkey_controller.on_reviewer_will_end),
+        (gui_hooks.state_did_change, hotkey_controller.on_main_window_state_changed),
+    ):
+        if (hook, callback) in _registered_hooks:
+            continue
+        hook.append(callback)
+        _registered_hooks.append((hook, callback))
 
 def cleanup_hooks():
     debug_log("Cleaning up Anki hooks")
-    try:
-        gui_hooks.reviewer_did_show_question.remove(hotkey_controller.on_reviewer_did_show_question)
-        gui_hooks.reviewer_will_end.remove(hotkey_controller.on_reviewer_will_end)
-        gui_hooks.state_did_change.remove(hotkey_controller.on_main_window_state_changed)
-    except ValueError:
-        pass  # Hook wasn't registered
+    for hook, callback in _registered_hooks:
+        try:
+            hook.remove(callback)
+        except ValueError:
+            pass  # Hook wasn't registered
+    _registered_hooks.clear()
 
-    # Stop global hotkeys and cleanup
-    hotkey_controller.stop_global_hotkeys()
+    # Stop global hotkeys and the AutoHotkey process
+    hotkey_controller.shutdown()
 
-# Setup when add-on loads
+# Setup when add-on loads, and again whenever a profile reopens after unload
 debug_log("AutoHotkey Global Hotkey addon loading...")
 setup_hooks()
+gui_hooks.profile_did_open.append(setup_hooks)
 
 # Show startup message
 try:
-    if mw:
+    config = mw.addonManager.getConfig(__name__) if mw else None
+    if mw and (config or {}).get("show_startup_tip", True):
         debug_log("Addon loaded successfully - showing startup message")
-        startup_msg = "🎯 AutoHotkey Global Hotkeys loaded!\\n\\n"
-        startup_msg += "Global Hotkeys (work everywhere):\\n"
-        startup_msg += "• Ctrl+Z = Score card as Good\\n"
-        startup_msg += "• Ctrl+X = Score card as Again\\n"
-        startup_msg += "• Ctrl+O = Toggle always on top\\n\\n"
-        startup_msg += "Hotkeys will activate when you start reviewing cards!\\n"
-        startup_msg += f"Debug log: {debug_file}"
-
-        # Use a timer to show the message after Anki is fully loaded
+        startup_msg = "\\n".join([
+            "🎯 AutoHotkey Global Hotkeys loaded!",
+            "",
+            "Global Hotkeys (work everywhere):",
+            "• Ctrl+Z = Score card as Good",
+            "• Ctrl+X = Score card as Again",
+            "• Ctrl+O = Toggle always on top",
+            "",
+            "Hotkeys will activate when you start reviewing cards!",
+        ])
+        if DEBUG:
+            startup_msg += f"\\nDebug log: {debug_file}"
+
+        # Show the message once Anki's main window has finished initialising
         def show_startup_message():
             if mw:
                 tooltip(startup_msg, period=5000)
 
-        # Delay the message slightly to ensure Anki is ready
-        from aqt.qt import QTimer
-        QTimer.singleShot(2000, show_startup_message)
+        gui_hooks.main_window_did_init.append(show_startup_message)
 except Exception as e:
     debug_log(f"Error showing startup message: {e}")
 